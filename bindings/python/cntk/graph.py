@@ -5,6 +5,7 @@
 # ==============================================================================
 
 import os
+import itertools
 from . import Variable
 
 def depth_first_search(node, visitor):
@@ -20,40 +21,50 @@ def depth_first_search(node, visitor):
     Returns:
         List of functions, for which ``visitor`` was ``True``
     '''
+    return list(_depth_first_search_iter(node, visitor))
+
+
+def _depth_first_search_iter(node, visitor):
+    '''
+    Generator version of :func:`depth_first_search`. It yields the matching
+    nodes in the same order without materializing them, so callers can stop
+    the traversal early.
+    '''
+    # The end of the list is the top of the stack. Inputs are pushed in
+    # reverse so that they are visited in their natural order, which avoids
+    # the quadratic cost of prepending to a list.
     stack = [node.root_function]
-    accum = []
     visited = set()
 
     while stack:
-        node = stack.pop(0)
+        node = stack.pop()
         if node in visited:
             continue
 
         try:
             # Function node
-            stack = list(node.root_function.inputs) + stack
+            stack.extend(reversed(node.root_function.inputs))
         except AttributeError:
             # OutputVariable node
             try:
                 if node.is_output:
-                    stack.insert(0, node.owner)
+                    stack.append(node.owner)
                     visited.add(node)
                     continue
             except AttributeError:
                 pass
 
-        if visitor(node):
-            if isinstance(node, Variable):
-                if node.is_parameter:
-                    node = node.as_parameter()
-                elif node.is_constant:
-                    node = node.as_constant()
-
-            accum.append(node)
+        found = visitor(node)
+        if found and isinstance(node, Variable):
+            if node.is_parameter:
+                node = node.as_parameter()
+            elif node.is_constant:
+                node = node.as_constant()
 
         visited.add(node)
 
-    return accum
+        if found:
+            yield node
 
 
 def find_all_with_name(node, node_name):
@@ -96,7 +107,9 @@ def find_by_name(node, node_name):
         raise ValueError('node name has to be a string. You gave '
                          'a %s' % type(node_name))
 
-    result = depth_first_search(node, lambda x: x.name == node_name)
+    # two matches are enough to tell that the name is ambiguous
+    result = list(itertools.islice(
+        _depth_first_search_iter(node, lambda x: x.name == node_name), 2))
 
     if len(result) > 1:
         raise ValueError('found multiple functions matching "%s". '
@@ -332,3 +332,11 @@ def test_session_restart_from_checkpoint(tmpdir, device_id):
     first_run_minibatch_info = [i for i in writer.minibatch_info if i[0] != 0]
 
     assert(first_run_minibatch_info == writer2.minibatch_info)
+
+def test_minibatch_size_schedule_int_is_shared():
+    s = minibatch_size_schedule(4)
+    assert s is minibatch_size_schedule(4)
+    assert s[0] == 4
+
+    # list schedules are not cached
+    assert minibatch_size_schedule([4, 8], 10) is not minibatch_size_schedule([4, 8], 10)
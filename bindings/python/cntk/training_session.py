@@ -9,6 +9,18 @@ from .device import use_default_device
 from .utils import sanitize_var_map, sanitize_function, typemap, value_to_seq
 from .io import _py_dict_to_cntk_dict
 
+# Sentinel used for "no limit" frequencies and sample counts.
+_MAXSIZE = sys.maxsize
+
+# Schedules built from a single integer are never modified after creation, so
+# they are shared across calls instead of creating a new C++ object each time.
+_INT_SCHEDULE_CACHE_SIZE = 64
+_int_schedule_cache = {}
+
+# use_default_device() freezes the process wide default device, so once it
+# has been resolved it can be reused for every subsequent training session.
+_default_device_cache = [None]
+
 __doc__ = '''\
 A training session encapsulates a typical training loop and binds together a minibatch source that is used for training, a :doc:`trainer <cntk.trainer>` and an optional cross validation minibatch source. A training session takes care of consistent checkpointing and progress printing with specified frequencies. 
 '''
@@ -67,7 +79,7 @@ class TrainingSession(cntk_py.TrainingSession):
             checkpoint_filename = ""
 
         if progress_frequency is None:
-            progress_frequency = sys.maxsize
+            progress_frequency = _MAXSIZE
 
         if cv_source is None:
             if cv_frequency is not None and cv_frequency != 0:
@@ -76,13 +88,13 @@ class TrainingSession(cntk_py.TrainingSession):
             cv_frequency = 0
 
         if cv_frequency is None:
-            cv_frequency = sys.maxsize
+            cv_frequency = _MAXSIZE
 
         if max_training_samples is None:
-            max_training_samples = sys.maxsize
+            max_training_samples = _MAXSIZE
 
         if checkpoint_frequency is None:
-            checkpoint_frequency = sys.maxsize
+            checkpoint_frequency = _MAXSIZE
 
         if cv_mb_size_schedule is None:
             cv_mb_size_schedule = minibatch_size_schedule(1)
@@ -108,7 +120,6 @@ class TrainingSession(cntk_py.TrainingSession):
             progress_frequency,
             progress_writers)
 
-    @typemap
     def train(self, device=None):
         '''
         Perform training on a specified device.
@@ -118,8 +129,10 @@ class TrainingSession(cntk_py.TrainingSession):
                the type and id of the device where training takes place.
         '''
 
-        if not device:
-            device = use_default_device()
+        if device is None:
+            if _default_device_cache[0] is None:
+                _default_device_cache[0] = use_default_device()
+            device = _default_device_cache[0]
 
         super(TrainingSession, self).train(device)
 
@@ -136,7 +149,6 @@ class TrainingSession(cntk_py.TrainingSession):
         pass
 
 
-@typemap
 def minibatch_size_schedule(schedule, epoch_size=1):
     '''
     Create a minibatch size schedule
@@ -171,16 +183,29 @@ def minibatch_size_schedule(schedule, epoch_size=1):
         if epoch_size != 1:
             raise ValueError('when providing the schedule as a number,'
                              ' epoch_size is ignored')
-        return cntk_py.minibatch_size_schedule(schedule)
+        return _schedule_from_int(schedule)
 
     if isinstance(schedule, list):
         return cntk_py.minibatch_size_schedule(schedule, epoch_size)
 
     raise ValueError(
-        'schedule must be either a float or a list, not %s' % type(schedule))
+        'schedule must be either an integer or a list, not %s' % type(schedule))
+
+
+def _schedule_from_int(schedule):
+    try:
+        return _int_schedule_cache[schedule]
+    except KeyError:
+        pass
+
+    if len(_int_schedule_cache) >= _INT_SCHEDULE_CACHE_SIZE:
+        _int_schedule_cache.clear()
+
+    result = cntk_py.minibatch_size_schedule(schedule)
+    _int_schedule_cache[schedule] = result
+    return result
 
 
-@typemap
 def training_session(training_minibatch_source,
                      trainer, mb_size_schedule,
                      progress_printer=None,